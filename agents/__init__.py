@@ -3,9 +3,23 @@ Multi-Agent PRD Review System
 Agents that collaborate to review and critique PRDs
 """
 
+import importlib
+
 from .validator_agent import ValidatorAgent
-from .skeptic_agent import SkepticAgent
-from .ux_agent import UXAgent
-from .legal_agent import LegalAgent
+
+# AI agents pull in the Anthropic SDK, so they are imported on first access (PEP 562)
+_LAZY_AGENTS = {
+    'SkepticAgent': '.skeptic_agent',
+    'UXAgent': '.ux_agent',
+    'LegalAgent': '.legal_agent',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_AGENTS:
+        module = importlib.import_module(_LAZY_AGENTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ['ValidatorAgent', 'SkepticAgent', 'UXAgent', 'LegalAgent']
\ No newline at end of file
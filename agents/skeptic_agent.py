@@ -5,8 +5,104 @@ Uses Claude API to generate technical critique
 """
 
 import os
-from anthropic import Anthropic
-from typing import Dict
+import re
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from utils.cache import CacheBackend, SemanticCache, make_cache_key
+from utils.prompts import load_prompt
+
+# Static task instructions; kept in the system prefix, not the user turn
+REVIEW_INSTRUCTIONS = """Review the PRD in the user message with your technical expertise.
+The message contains the validation results followed by the PRD content.
+
+Provide your technical critique following the format specified in your role.
+Focus on the HARDEST technical challenges and RISKIEST assumptions.
+Be specific and actionable."""
+
+# Maximum number of requests Anthropic accepts in a single message batch
+BATCH_MAX_REQUESTS = 10000
+
+# Ends a PRD section cut short to fit SKEPTIC_MAX_PRD_CHARS
+TRUNCATION_MARKER = "\n[... section truncated to fit the review budget ...]\n\n"
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str):
+    """Shared sync Anthropic client per API key, so agents reuse one connection pool"""
+    # Deferred so importing this module does not load the Anthropic SDK
+    from anthropic import Anthropic
+    
+    return Anthropic(api_key=api_key)
+
+
+@lru_cache(maxsize=128)
+def _format_validation_summary(
+    score: int,
+    status: str,
+    missing_critical: Tuple[str, ...],
+    missing_high: Tuple[str, ...]
+) -> str:
+    """Render the validation summary; memoised since batches repeat the same reports"""
+    validation_summary = f"**Validation Score:** {score}/100 ({status})\n\n"
+    
+    if missing_critical:
+        validation_summary += f"**Critical Sections Missing:**\n"
+        for section in missing_critical:
+            validation_summary += f"- {section}\n"
+        validation_summary += "\n"
+    
+    if missing_high:
+        validation_summary += f"**High Priority Sections Missing:**\n"
+        for section in missing_high:
+            validation_summary += f"- {section}\n"
+        validation_summary += "\n"
+    
+    return validation_summary
+
+
+def truncate_prd(prd_text: str, budget: int) -> str:
+    """
+    Trim a PRD to a character budget, keeping sections in order
+    
+    Whole sections are kept while they fit; the first section that does
+    not fit is cut to fill the remaining budget and ends with a
+    truncation marker.
+    
+    Args:
+        prd_text: Full PRD text
+        budget: Maximum characters to keep (0 or less disables truncation)
+        
+    Returns:
+        PRD text within the budget (unchanged if it already fits)
+    """
+    if budget <= 0 or len(prd_text) <= budget:
+        return prd_text
+    
+    kept = []
+    used = 0
+    for part in re.split(r'^(?=#)', prd_text, flags=re.M):
+        # A PRD starting with a heading yields an empty first part
+        if not part:
+            continue
+        
+        remaining = budget - used
+        if len(part) <= remaining:
+            kept.append(part)
+            used += len(part)
+            continue
+        
+        room = remaining - len(TRUNCATION_MARKER)
+        if room > 0:
+            kept.append(part[:room] + TRUNCATION_MARKER)
+        elif not kept:
+            # Budget smaller than the marker: hard cut rather than send nothing
+            kept.append(part[:budget])
+        break
+    
+    return ''.join(kept)
 
 
 class SkepticAgent:
@@ -17,49 +113,320 @@ class SkepticAgent:
     about assumptions, feasibility, scale, and edge cases
     """
     
-    def __init__(self, api_key: str = None, system_prompt_path: str = "prompts/skeptic_system.txt"):
+    def __init__(
+        self,
+        api_key: str = None,
+        system_prompt_path: str = "prompts/skeptic_system.txt",
+        cache: Optional[CacheBackend] = None,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
         """
         Initialize Skeptic Agent with Claude API
         
         Args:
             api_key: Anthropic API key (reads from env if not provided)
             system_prompt_path: Path to system prompt file
+            cache: Optional exact-match response cache (e.g. DiskCache)
+            semantic_cache: Optional near-duplicate PRD cache
         """
         self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment or provided")
         
-        self.client = Anthropic(api_key=self.api_key)
+        self._client = None
         self.model = "claude-sonnet-4-6"
         
-        # Load system prompt
-        with open(system_prompt_path, 'r', encoding='utf-8') as f:
-            self.system_prompt = f.read()
+        # Load system prompt (cached per process)
+        self.system_prompt = load_prompt(system_prompt_path)
+        
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        
+        # Character budget for the PRD in the prompt; 0 disables truncation
+        self.max_prd_chars = int(os.environ.get('SKEPTIC_MAX_PRD_CHARS', '20000'))
+    
+    @property
+    def client(self):
+        """Shared sync Anthropic client, created on first use so cache hits need no SDK"""
+        if self._client is None:
+            self._client = _get_client(self.api_key)
+        return self._client
     
-    def challenge(self, prd_text: str, validation_report: Dict) -> Dict:
+    def challenge(self, prd_text: str, validation_report: Dict, stream: bool = False) -> Dict:
         """
         Generate technical critique of PRD
         
         Args:
             prd_text: Full PRD text
             validation_report: Validation results from ValidatorAgent
+            stream: Print the critique to stdout as tokens arrive
             
         Returns:
             Dictionary with critique content and metadata
         """
+        validation_summary = self._build_validation_summary(validation_report)
+        
+        # Reuse an earlier critique of the same PRD if one is cached
+        cache_key = self._cache_key(prd_text, validation_summary)
+        cached = self._cache_get(cache_key, prd_text, validation_summary)
+        if cached is not None:
+            if stream:
+                self._write_stream(cached['critique'] + "\n")
+            return cached
+        
         # Build user prompt combining PRD and validation results
-        user_prompt = self._build_user_prompt(prd_text, validation_report)
+        user_prompt = self._build_user_prompt(prd_text, validation_summary)
         
         # Call Claude API
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=2000,
-            system=self.system_prompt,
-            messages=[
+        params = self._request_params(user_prompt)
+        if stream:
+            # Final message carries the full text and usage, same as create()
+            with self.client.messages.stream(**params) as response_stream:
+                for text in response_stream.text_stream:
+                    self._write_stream(text)
+                response = response_stream.get_final_message()
+            self._write_stream("\n")
+        else:
+            response = self.client.messages.create(**params)
+        
+        result = self._format_response(response)
+        self._cache_set(cache_key, prd_text, validation_summary, result)
+        return result
+    
+    def open_async_client(self):
+        """
+        Create an async Anthropic client for use with `async with`
+        
+        Async clients pool connections bound to the running event loop, so
+        open one per asyncio.run() and share it across that loop's critiques.
+        """
+        from anthropic import AsyncAnthropic
+        
+        return AsyncAnthropic(api_key=self.api_key)
+    
+    async def achallenge(
+        self,
+        prd_text: str,
+        validation_report: Dict,
+        stream: bool = False,
+        async_client=None
+    ) -> Dict:
+        """
+        Async variant of challenge() so several critiques can be awaited concurrently
+        
+        Args:
+            prd_text: Full PRD text
+            validation_report: Validation results from ValidatorAgent
+            stream: Print the critique to stdout as tokens arrive
+            async_client: Client from open_async_client() for the running loop
+                (a temporary one is opened when not provided)
+            
+        Returns:
+            Dictionary with critique content and metadata
+        """
+        validation_summary = self._build_validation_summary(validation_report)
+        
+        cache_key = self._cache_key(prd_text, validation_summary)
+        cached = self._cache_get(cache_key, prd_text, validation_summary)
+        if cached is not None:
+            if stream:
+                self._write_stream(cached['critique'] + "\n")
+            return cached
+        
+        user_prompt = self._build_user_prompt(prd_text, validation_summary)
+        
+        params = self._request_params(user_prompt)
+        
+        if async_client is None:
+            async with self.open_async_client() as owned_client:
+                response = await self._acreate(owned_client, params, stream)
+        else:
+            response = await self._acreate(async_client, params, stream)
+        
+        result = self._format_response(response)
+        self._cache_set(cache_key, prd_text, validation_summary, result)
+        return result
+    
+    async def _acreate(self, async_client, params: Dict, stream: bool):
+        """Send one messages request on async_client, streaming text if asked"""
+        if not stream:
+            return await async_client.messages.create(**params)
+        
+        async with async_client.messages.stream(**params) as response_stream:
+            async for text in response_stream.text_stream:
+                self._write_stream(text)
+            response = await response_stream.get_final_message()
+        self._write_stream("\n")
+        return response
+    
+    def challenge_many(
+        self,
+        items: List[Tuple[str, Dict]],
+        poll_interval: float = 30.0
+    ) -> Tuple[List[Optional[Dict]], Dict[int, str]]:
+        """
+        Generate technical critiques for many PRDs via the Message Batches API
+        
+        Batched requests are billed at half the standard rate but can take
+        minutes to complete, so this suits CI/bulk reviews; use challenge()
+        for interactive reviews.
+        
+        Requests the batch does not complete are retried individually via
+        challenge(); an item that fails again is left as None so the other
+        critiques are still returned.
+        
+        Args:
+            items: List of (prd_text, validation_report) tuples
+            poll_interval: Seconds to wait between batch status checks
+            
+        Returns:
+            Tuple of (critique dictionaries in the same order as items, with
+            None where no critique could be generated; failure reason by
+            item index for those Nones)
+        """
+        results: List[Optional[Dict]] = [None] * len(items)
+        failures: Dict[int, str] = {}
+        batch_errors: Dict[str, str] = {}
+        pending = {}
+        requests = []
+        
+        for index, (prd_text, validation_report) in enumerate(items):
+            validation_summary = self._build_validation_summary(validation_report)
+            cache_key = self._cache_key(prd_text, validation_summary)
+            cached = self._cache_get(cache_key, prd_text, validation_summary)
+            if cached is not None:
+                results[index] = cached
+                continue
+            
+            custom_id = f"prd-{index}"
+            pending[custom_id] = (index, cache_key, prd_text, validation_summary)
+            user_prompt = self._build_user_prompt(prd_text, validation_summary)
+            requests.append({"custom_id": custom_id, "params": self._request_params(user_prompt)})
+        
+        # Submit every chunk up front so they are processed in parallel
+        batches = [
+            self.client.messages.batches.create(requests=requests[start:start + BATCH_MAX_REQUESTS])
+            for start in range(0, len(requests), BATCH_MAX_REQUESTS)
+        ]
+        
+        for batch in batches:
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+            
+            for entry in self.client.messages.batches.results(batch.id):
+                if entry.result.type != "succeeded":
+                    batch_errors[entry.custom_id] = entry.result.type
+                    continue
+                
+                index, cache_key, prd_text, validation_summary = pending.pop(entry.custom_id)
+                result = self._format_response(entry.result.message)
+                self._cache_set(cache_key, prd_text, validation_summary, result)
+                results[index] = result
+        
+        # Anything still pending errored, expired or was canceled in the batch
+        for custom_id, (index, _, _, _) in pending.items():
+            prd_text, validation_report = items[index]
+            try:
+                results[index] = self.challenge(prd_text, validation_report)
+            except Exception as exc:
+                batch_status = batch_errors.get(custom_id, "missing")
+                failures[index] = f"batch request {batch_status}, retry failed: {exc}"
+        
+        return results, failures
+    
+    def _request_params(self, user_prompt: str) -> Dict:
+        """
+        Keyword arguments shared by every Claude messages call
+        
+        The system prompt and instructions form the only cache breakpoint.
+        Prompt caching takes effect once that prefix reaches the model's
+        minimum cacheable length (1024 tokens on Sonnet); the current prompt
+        is below it. The per-PRD user message is deliberately not cached:
+        writes cost more than uncached input and exact repeats are already
+        served by the response cache.
+        """
+        return {
+            "model": self.model,
+            "max_tokens": 2000,
+            "system": [
+                {"type": "text", "text": self.system_prompt},
+                {
+                    "type": "text",
+                    "text": REVIEW_INSTRUCTIONS,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ],
+            "messages": [
                 {"role": "user", "content": user_prompt}
             ]
-        )
+        }
+    
+    @staticmethod
+    def _write_stream(text: str):
+        """Write streamed critique text to stdout without buffering"""
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    
+    def _cache_fields(self, validation_summary: str) -> Dict:
+        """Request inputs other than the PRD that shape the critique"""
+        return {
+            "model": self.model,
+            "system": self.system_prompt,
+            "instructions": REVIEW_INSTRUCTIONS,
+            "max_prd_chars": self.max_prd_chars,
+            "val": validation_summary
+        }
+    
+    def _cache_key(self, prd_text: str, validation_summary: str) -> str:
+        """Exact-match cache key covering everything that shapes the critique"""
+        return make_cache_key(**self._cache_fields(validation_summary), prd=prd_text)
+    
+    def _cache_scope(self, validation_summary: str) -> str:
+        """Semantic cache scope: the exact key's fields minus the PRD itself"""
+        return make_cache_key(**self._cache_fields(validation_summary))
+    
+    def _cache_get(self, cache_key: str, prd_text: str, validation_summary: str) -> Optional[Dict]:
+        """Look up the exact-match cache first, then the semantic cache"""
+        cached = None
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+        
+        if cached is None and self.semantic_cache is not None:
+            cached = self.semantic_cache.get(prd_text, scope=self._cache_scope(validation_summary))
+        
+        if cached is None:
+            return None
         
+        # A hit costs no tokens; report zero usage rather than the original call's
+        return {
+            **cached,
+            "cached": True,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0,
+            "cache_read_tokens": 0,
+            "cache_creation_tokens": 0
+        }
+    
+    def _cache_set(self, cache_key: str, prd_text: str, validation_summary: str, result: Dict):
+        """Store a fresh critique in every configured cache"""
+        if self.cache is not None:
+            self.cache.set(cache_key, result)
+        
+        if self.semantic_cache is not None:
+            self.semantic_cache.set(prd_text, result, scope=self._cache_scope(validation_summary))
+    
+    def _format_response(self, response) -> Dict:
+        """
+        Convert a Claude API response into the critique dictionary
+        
+        Args:
+            response: Message returned by the Anthropic client
+            
+        Returns:
+            Dictionary with critique content and metadata
+        """
         # Extract critique text
         critique_text = response.content[0].text
         
@@ -68,54 +435,45 @@ class SkepticAgent:
             "model": self.model,
             "prompt_tokens": response.usage.input_tokens,
             "completion_tokens": response.usage.output_tokens,
-            "total_tokens": response.usage.input_tokens + response.usage.output_tokens
+            "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
+            "cache_read_tokens": getattr(response.usage, 'cache_read_input_tokens', None) or 0,
+            "cache_creation_tokens": getattr(response.usage, 'cache_creation_input_tokens', None) or 0,
+            "cached": False
         }
     
-    def _build_user_prompt(self, prd_text: str, validation_report: Dict) -> str:
+    def _build_validation_summary(self, validation_report: Dict) -> str:
         """
-        Build the user prompt combining PRD and validation context
+        Summarise validation results for the prompt
         
         Args:
-            prd_text: Full PRD text
             validation_report: Validation results
             
         Returns:
-            Formatted prompt string
+            Markdown summary of score and missing sections
         """
-        # Extract validation context
-        score = validation_report['score']
-        status = validation_report['status']
-        missing_critical = validation_report.get('missing_critical', [])
-        missing_high = validation_report.get('missing_high', [])
-        
-        # Build validation summary
-        validation_summary = f"**Validation Score:** {score}/100 ({status})\n\n"
-        
-        if missing_critical:
-            validation_summary += f"**Critical Sections Missing:**\n"
-            for section in missing_critical:
-                validation_summary += f"- {section}\n"
-            validation_summary += "\n"
-        
-        if missing_high:
-            validation_summary += f"**High Priority Sections Missing:**\n"
-            for section in missing_high:
-                validation_summary += f"- {section}\n"
-            validation_summary += "\n"
+        return _format_validation_summary(
+            validation_report['score'],
+            validation_report['status'],
+            tuple(validation_report.get('missing_critical', [])),
+            tuple(validation_report.get('missing_high', []))
+        )
+    
+    def _build_user_prompt(self, prd_text: str, validation_summary: str) -> str:
+        """
+        Build the user prompt combining PRD and validation context
         
-        # Combine into full prompt
-        prompt = f"""Review this PRD with your technical expertise.
-
-VALIDATION RESULTS:
+        Args:
+            prd_text: Full PRD text (truncated to max_prd_chars)
+            validation_summary: Output of _build_validation_summary()
+            
+        Returns:
+            Formatted prompt string
+        """
+        # Dynamic content only; static instructions live in REVIEW_INSTRUCTIONS
+        prompt = f"""VALIDATION RESULTS:
 {validation_summary}
 
 PRD CONTENT:
-{prd_text}
-
----
-
-Provide your technical critique following the format specified in your role.
-Focus on the HARDEST technical challenges and RISKIEST assumptions.
-Be specific and actionable."""
+{truncate_prd(prd_text, self.max_prd_chars)}"""
 
-        return prompt
\ No newline at end of file
+        return prompt
@@ -5,9 +5,10 @@ Uses Claude API to generate UX critique
 """
 
 import os
-from anthropic import Anthropic
 from typing import Dict
 
+from utils.prompts import load_prompt
+
 
 class UXAgent:
     """
@@ -30,11 +31,13 @@ class UXAgent:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment or provided")
 
+        # Deferred so importing the class does not load the Anthropic SDK
+        from anthropic import Anthropic
+
         self.client = Anthropic(api_key=self.api_key)
         self.model = "claude-sonnet-4-6"
 
-        with open(system_prompt_path, 'r', encoding='utf-8') as f:
-            self.system_prompt = f.read()
+        self.system_prompt = load_prompt(system_prompt_path)
 
     def review(self, prd_text: str, validation_report: Dict, technical_critique: str) -> Dict:
         """
@@ -3,19 +3,36 @@ Validator Agent
 Wraps the existing PRD validation logic to check completeness
 """
 
+import os
+import re
 import yaml
+import pickle
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+try:
+    import ahocorasick
+except ImportError:  # optional; a compiled regex scanner is used without it
+    ahocorasick = None
 
-@dataclass
+# C-accelerated safe loader; falls back to the pure-Python one without libyaml
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Below this many PRD characters in a batch, worker start-up costs more than it saves
+PARALLEL_MIN_CHARS = 20_000_000
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
-    """Result from validating a single section"""
+    """Result from validating a single section (immutable, shared by the result cache)"""
     section_name: str
     required: bool
     found: bool
     severity: str
-    keywords_found: List[str]
+    keywords_found: Tuple[str, ...]
     score: int
 
 
@@ -37,11 +54,118 @@ class ValidatorAgent:
         self.template_path = template_path
         self.template = self._load_template()
         self.scoring = self.template.get('scoring', {})
+        self._build_matcher()
+        
+        # Per-instance LRU so repeat validations of the same text are O(1).
+        # It wraps a bound method (agent -> cache -> method -> agent), so the
+        # cache is freed by the cyclic garbage collector, not on last reference
+        self._validate_cached = functools.lru_cache(maxsize=128)(self._scan)
         
     def _load_template(self) -> dict:
-        """Load and parse YAML template"""
+        """
+        Load and parse YAML template (LibYAML parser when PyYAML was built with it)
+        
+        With PRD_TEMPLATE_CACHE=1 the parsed template is also pickled next to
+        the YAML file and reused while it is at least as new as the YAML.
+        """
+        use_cache = os.environ.get('PRD_TEMPLATE_CACHE') == '1'
+        pickle_path = self.template_path + '.pkl'
+        
+        if use_cache:
+            try:
+                if os.path.getmtime(pickle_path) >= os.path.getmtime(self.template_path):
+                    with open(pickle_path, 'rb') as f:
+                        return pickle.load(f)
+            except Exception:
+                pass  # missing or corrupt cache (unpickling can raise anything): fall back to YAML
+        
         with open(self.template_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            template = yaml.load(f, Loader=_YAML_LOADER)
+        
+        if use_cache:
+            # Write then rename so concurrent loaders never see a partial file
+            tmp_path = f"{pickle_path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(template, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, pickle_path)
+            except OSError:
+                pass  # read-only template directory: keep working uncached
+        
+        return template
+    
+    def _build_matcher(self):
+        """
+        Flatten section metadata and compile all keywords into one matcher
+        
+        The matcher finds every keyword in a single pass over the PRD,
+        instead of one substring scan per keyword per section. An
+        Aho-Corasick automaton is used when pyahocorasick is installed,
+        otherwise a single compiled regex.
+        """
+        # Parallel per-section arrays, resolved once so validate() does no dict lookups
+        self._names: List[str] = []
+        self._required: List[bool] = []
+        self._severities: List[str] = []
+        self._weights: List[int] = []
+        self._keywords: List[Tuple[str, ...]] = []
+        self._kw_cf: List[Tuple[str, ...]] = []
+        
+        for section in self.template.get('sections', []):
+            severity = section['severity']
+            keywords = tuple(section.get('keywords', []))
+            self._names.append(section['name'])
+            self._required.append(section['required'])
+            self._severities.append(severity)
+            self._weights.append(self.scoring.get(f"{severity}_weight", 0))
+            self._keywords.append(keywords)
+            self._kw_cf.append(tuple(kw.casefold() for kw in keywords))
+        
+        # Max possible score depends only on the template
+        self._max_score = sum(w for w, required in zip(self._weights, self._required) if required)
+        
+        hits_by_keyword = {}
+        for section_idx, kw_cf in enumerate(self._kw_cf):
+            for keyword_idx, kw in enumerate(kw_cf):
+                if kw:
+                    hits_by_keyword.setdefault(kw, []).append((section_idx, keyword_idx))
+        
+        # Keywords shared by several sections map to every (section, keyword) pair
+        self._ac = None
+        self._pattern = None
+        if not hits_by_keyword:
+            return
+        
+        if ahocorasick is not None:
+            self._ac = ahocorasick.Automaton()
+            for kw_cf, hits in hits_by_keyword.items():
+                self._ac.add_word(kw_cf, tuple(hits))
+            self._ac.make_automaton()
+            return
+        
+        # Regex fallback: a zero-width lookahead tries every position and the
+        # longest-first alternation reports the longest keyword starting there.
+        # Shorter keywords at the same position are prefixes of it, so each
+        # match expands to the hits of all its keyword prefixes.
+        ordered = sorted(hits_by_keyword, key=len, reverse=True)
+        self._pattern = re.compile("(?=(" + "|".join(re.escape(kw) for kw in ordered) + "))")
+        self._prefix_hits = {
+            kw: tuple(
+                hit
+                for prefix, hits in hits_by_keyword.items() if kw.startswith(prefix)
+                for hit in hits
+            )
+            for kw in hits_by_keyword
+        }
+    
+    def _iter_hits(self, prd_norm: str):
+        """Yield (section_idx, keyword_idx) tuples for each keyword occurrence"""
+        if self._ac is not None:
+            for _, hits in self._ac.iter(prd_norm):
+                yield hits
+        elif self._pattern is not None:
+            for match in self._pattern.finditer(prd_norm):
+                yield self._prefix_hits[match.group(1)]
     
     def validate(self, prd_text: str) -> Tuple[List[ValidationResult], int]:
         """
@@ -53,51 +177,99 @@ class ValidatorAgent:
         Returns:
             Tuple of (list of ValidationResults, overall score)
         """
-        # Convert PRD to lowercase for case-insensitive matching
-        prd_lower = prd_text.lower()
+        results, overall_score = self._validate_cached(prd_text)
+        return list(results), overall_score
+    
+    def _scan(self, prd_text: str) -> Tuple[Tuple[ValidationResult, ...], int]:
+        """
+        Uncached validation pass, memoised per instance by validate()
+        
+        Args:
+            prd_text: The full PRD text to validate
+            
+        Returns:
+            Tuple of (tuple of ValidationResults, overall score)
+        """
+        # Casefold PRD once for case-insensitive matching (handles e.g. ß/ss, unlike lower())
+        prd_norm = prd_text.casefold()
+        
+        # Single pass: collect matched keyword indices per section
+        section_count = len(self._names)
+        found_map = [set() for _ in range(section_count)]
+        for hits in self._iter_hits(prd_norm):
+            for section_idx, keyword_idx in hits:
+                found_map[section_idx].add(keyword_idx)
         
         results = []
         total_score = 0
-        max_score = 0
         
         # Check each section in template
-        for section in self.template.get('sections', []):
-            section_name = section['name']
-            required = section['required']
-            severity = section['severity']
-            keywords = section.get('keywords', [])
-            
-            # Check if any keywords are found in PRD
-            keywords_found = [kw for kw in keywords if kw.lower() in prd_lower]
+        for i in range(section_count):
+            # Keep keywords in template order, as declared
+            matched = found_map[i]
+            keywords_found = tuple(kw for keyword_idx, kw in enumerate(self._keywords[i]) if keyword_idx in matched)
             found = len(keywords_found) > 0
             
             # Calculate score for this section
-            weight_key = f"{severity}_weight"
-            section_weight = self.scoring.get(weight_key, 0)
-            section_score = section_weight if found else 0
-            
-            # Track max possible score
-            if required:
-                max_score += section_weight
+            section_score = self._weights[i] if found else 0
             
             # Add to total if found
             total_score += section_score
             
             # Create result
             result = ValidationResult(
-                section_name=section_name,
-                required=required,
+                section_name=self._names[i],
+                required=self._required[i],
                 found=found,
-                severity=severity,
+                severity=self._severities[i],
                 keywords_found=keywords_found,
                 score=section_score
             )
             results.append(result)
         
-        # Calculate percentage score
+        # Calculate percentage score (division kept, not a precomputed reciprocal:
+        # 100/max rounds differently and can shift a score across a status threshold)
+        max_score = self._max_score
         overall_score = int((total_score / max_score * 100)) if max_score > 0 else 0
         
-        return results, overall_score
+        return tuple(results), overall_score
+    
+    def validate_batch(
+        self,
+        prd_texts: List[str],
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[List[ValidationResult], int]]:
+        """
+        Validate many PRDs, e.g. a directory of PRDs in a CI quality gate
+        
+        Scanning holds the GIL, so large batches are spread over a pool of
+        spawned worker processes, each building its own matcher once.
+        Smaller batches run in-process through the result cache.
+        
+        The pool uses the 'spawn' start method, which re-imports the
+        caller's main module in every worker: scripts calling this must
+        keep their entry point under an `if __name__ == "__main__":` guard.
+        
+        Args:
+            prd_texts: PRD texts to validate
+            max_workers: Worker processes (defaults to CPU count; 1 forces in-process)
+            
+        Returns:
+            List of (list of ValidationResults, overall score), in input order
+        """
+        total_chars = sum(len(prd_text) for prd_text in prd_texts)
+        if max_workers == 1 or len(prd_texts) < 2 or total_chars < PARALLEL_MIN_CHARS:
+            return [self.validate(prd_text) for prd_text in prd_texts]
+        
+        workers = max_workers or multiprocessing.cpu_count()
+        chunksize = max(1, len(prd_texts) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self.template_path,)
+        ) as pool:
+            return list(pool.map(_validate_in_worker, prd_texts, chunksize=chunksize))
     
     def format_report(self, results: List[ValidationResult], score: int) -> dict:
         """
@@ -110,11 +282,17 @@ class ValidatorAgent:
         Returns:
             Dictionary with formatted report data
         """
-        # Categorize results
-        missing_critical = [r for r in results if not r.found and r.required and r.severity == 'critical']
-        missing_high = [r for r in results if not r.found and r.required and r.severity == 'high']
-        missing_medium = [r for r in results if not r.found and r.severity == 'medium']
-        found = [r for r in results if r.found]
+        # Categorize results in a single pass
+        missing_critical, missing_high, missing_medium, found = [], [], [], []
+        for r in results:
+            if r.found:
+                found.append(r.section_name)
+            elif r.required and r.severity == 'critical':
+                missing_critical.append(r.section_name)
+            elif r.required and r.severity == 'high':
+                missing_high.append(r.section_name)
+            elif r.severity == 'medium':
+                missing_medium.append(r.section_name)
         
         # Determine status
         if score >= 90:
@@ -131,11 +309,24 @@ class ValidatorAgent:
             "score": score,
             "status": status,
             "status_emoji": status_emoji,
-            "missing_critical": [r.section_name for r in missing_critical],
-            "missing_high": [r.section_name for r in missing_high],
-            "missing_medium": [r.section_name for r in missing_medium],
-            "found_sections": [r.section_name for r in found],
+            "missing_critical": missing_critical,
+            "missing_high": missing_high,
+            "missing_medium": missing_medium,
+            "found_sections": found,
             "total_sections": len(results),
             "found_count": len(found),
             "missing_count": len(results) - len(found)
-        }
\ No newline at end of file
+        }
+
+
+# Per-process validator used by ValidatorAgent.validate_batch() workers
+_worker_agent = None
+
+
+def _init_worker(template_path: str):
+    global _worker_agent
+    _worker_agent = ValidatorAgent(template_path)
+
+
+def _validate_in_worker(prd_text: str) -> Tuple[List[ValidationResult], int]:
+    return _worker_agent.validate(prd_text)
@@ -5,13 +5,22 @@ Coordinates four specialised agents to produce a comprehensive PRD review
 
 import os
 import json
+import time
+import asyncio
+from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used without it
+    orjson = None
+
 from agents.validator_agent import ValidatorAgent
 from agents.skeptic_agent import SkepticAgent
 from agents.ux_agent import UXAgent
 from agents.legal_agent import LegalAgent
+from utils.cache import DiskCache
 
 load_dotenv()
 
@@ -30,54 +39,260 @@ class PRDReviewOrchestrator:
 
     def __init__(self, template_path: str = "templates/prd_template.yaml"):
         self.validator = ValidatorAgent(template_path)
-        self.skeptic = SkepticAgent()
+        # Opt-in critique cache for dev/CI runs that re-review the same PRD
+        cache_dir = os.environ.get('SKEPTIC_CACHE_DIR')
+        self.skeptic = SkepticAgent(cache=DiskCache(cache_dir) if cache_dir else None)
         self.ux_reviewer = UXAgent()
         self.legal_reviewer = LegalAgent()
-
-    def review_prd(self, prd_text: str, prd_name: str = "Untitled PRD") -> dict:
+        # Reviews in flight at once when reviewing many PRDs (avoids 429s)
+        self.max_concurrent_reviews = max(1, int(os.environ.get('PRD_REVIEW_CONCURRENCY', '4')))
+        # Output directories already created by save_review() in this process
+        self._ensured_dirs: set = set()
+        # Paths written by save_review(), so same-second saves never collide
+        self._saved_paths: set = set()
+
+    def review_prd(self, prd_text: str, prd_name: str = "Untitled PRD", stream: bool = False) -> dict:
         """
         Run complete four-agent review of a PRD
 
+        Synchronous wrapper around areview_prd() for CLI and Slack callers
+
+        Args:
+            prd_text: Full PRD text to review
+            prd_name: Name/title of the PRD
+            stream: Print the technical critique as it is generated
+
+        Returns:
+            Dictionary with complete review results from all agents
+        """
+        async def _review():
+            async with self.skeptic.open_async_client() as async_client:
+                return await self.areview_prd(
+                    prd_text, prd_name, stream=stream, async_client=async_client
+                )
+
+        return asyncio.run(_review())
+
+    def review_prd_many(self, prds: list) -> list:
+        """
+        Review several PRDs concurrently
+
+        Synchronous wrapper around review_many() for CLI callers
+
+        Args:
+            prds: List of (prd_text, prd_name) tuples
+
+        Returns:
+            List of review dictionaries in the same order as prds,
+            with None for any PRD whose review failed
+        """
+        return asyncio.run(self.review_many(prds))
+
+    async def review_many(self, prds: list) -> list:
+        """
+        Review several PRDs concurrently
+
+        The pipeline is I/O-bound on Claude API calls, so overlapping the
+        reviews makes a batch of N PRDs take roughly as long as one. At most
+        max_concurrent_reviews (PRD_REVIEW_CONCURRENCY) run at a time and all
+        share one async client. A failed review is reported and does not
+        discard the others.
+
+        Args:
+            prds: List of (prd_text, prd_name) tuples
+
+        Returns:
+            List of review dictionaries in the same order as prds,
+            with None for any PRD whose review failed
+        """
+        async with self.skeptic.open_async_client() as async_client:
+            return await self._gather_reviews(
+                [prd_name for _, prd_name in prds],
+                [
+                    self.areview_prd(
+                        prd_text, prd_name, label_progress=True, async_client=async_client
+                    )
+                    for prd_text, prd_name in prds
+                ]
+            )
+
+    async def _gather_reviews(self, prd_names: list, reviews: list) -> list:
+        """
+        Await review coroutines concurrently, isolating per-PRD failures
+
+        At most max_concurrent_reviews coroutines run at a time.
+
+        Args:
+            prd_names: PRD names, parallel to reviews
+            reviews: Review coroutines
+
+        Returns:
+            List of review dictionaries, with None where a review raised
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_reviews)
+
+        async def _limited(review):
+            async with semaphore:
+                return await review
+
+        outcomes = await asyncio.gather(
+            *(_limited(review) for review in reviews),
+            return_exceptions=True
+        )
+
+        results = []
+        for prd_name, outcome in zip(prd_names, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"\n[{prd_name}] Review failed: {outcome}")
+                results.append(None)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.append(outcome)
+
+        return results
+
+    async def areview_prd(
+        self,
+        prd_text: str,
+        prd_name: str = "Untitled PRD",
+        stream: bool = False,
+        label_progress: bool = False,
+        async_client=None
+    ) -> dict:
+        """
+        Run complete four-agent review of a PRD without blocking the event loop
+
         Args:
             prd_text: Full PRD text to review
             prd_name: Name/title of the PRD
+            stream: Print the technical critique as it is generated
+            label_progress: Prefix progress lines with the PRD name (concurrent reviews)
+            async_client: Skeptic async client shared by this event loop's reviews
 
         Returns:
             Dictionary with complete review results from all agents
         """
+        prefix = f"[{prd_name}] " if label_progress else ""
+
         print(f"\n{'='*80}")
         print(f"MULTI-AGENT PRD REVIEW: {prd_name}")
         print(f"{'='*80}\n")
 
         # Step 1: Validator Agent
-        print("Step 1/4: Running Validator Agent...")
+        print(f"{prefix}Step 1/4: Running Validator Agent...")
         validation_results, score = self.validator.validate(prd_text)
         validation_report = self.validator.format_report(validation_results, score)
-        print(f"   Validation complete: {score}/100 {validation_report['status_emoji']}")
+        print(f"{prefix}   Validation complete: {score}/100 {validation_report['status_emoji']}")
 
         # Step 2: Skeptic Agent
-        print("\nStep 2/4: Running Skeptical Tech Lead Agent...")
-        skeptic_result = self.skeptic.challenge(prd_text, validation_report)
-        print(f"   Technical critique complete ({skeptic_result['total_tokens']} tokens)")
+        print(f"\n{prefix}Step 2/4: Running Skeptical Tech Lead Agent...")
+        skeptic_result = await self.skeptic.achallenge(
+            prd_text, validation_report, stream=stream, async_client=async_client
+        )
+        if skeptic_result.get('cached'):
+            print(f"{prefix}   Technical critique complete (cached)")
+        else:
+            print(f"{prefix}   Technical critique complete ({skeptic_result['total_tokens']} tokens)")
 
-        # Step 3: UX Agent
-        print("\nStep 3/4: Running UX and Design Reviewer Agent...")
-        ux_result = self.ux_reviewer.review(
+        return await self._acomplete_review(
+            prd_text, prd_name, validation_report, skeptic_result, prefix=prefix
+        )
+
+    def review_many_batched(self, prds: list) -> list:
+        """
+        Review several PRDs, sending Skeptic calls through the Message Batches API
+
+        Halves the cost of the technical critiques for CI/bulk runs at the
+        price of latency (batches can take minutes). UX and Legal reviews
+        then run concurrently as in review_many().
+
+        Args:
+            prds: List of (prd_text, prd_name) tuples
+
+        Returns:
+            List of review dictionaries in the same order as prds,
+            with None for any PRD whose review failed
+        """
+        print(f"\n{'='*80}")
+        print(f"BATCHED MULTI-AGENT PRD REVIEW: {len(prds)} PRDs")
+        print(f"{'='*80}\n")
+
+        print("Step 1/4: Running Validator Agent...")
+        validation_reports = []
+        for prd_text, prd_name in prds:
+            validation_results, score = self.validator.validate(prd_text)
+            validation_reports.append(self.validator.format_report(validation_results, score))
+            print(f"   {prd_name}: {score}/100 {validation_reports[-1]['status_emoji']}")
+
+        print("\nStep 2/4: Running Skeptical Tech Lead Agent (message batch)...")
+        skeptic_results, skeptic_failures = self.skeptic.challenge_many([
+            (prd_text, validation_report)
+            for (prd_text, _), validation_report in zip(prds, validation_reports)
+        ])
+        completed = [index for index, result in enumerate(skeptic_results) if result is not None]
+        print(f"   Technical critiques complete ({len(completed)}/{len(prds)} PRDs)")
+        for index, reason in sorted(skeptic_failures.items()):
+            print(f"\n[{prds[index][1]}] Review failed: {reason}")
+
+        reviews = [None] * len(prds)
+        completed_reviews = asyncio.run(self._gather_reviews(
+            [prds[index][1] for index in completed],
+            [
+                self._acomplete_review(
+                    prds[index][0], prds[index][1],
+                    validation_reports[index], skeptic_results[index],
+                    prefix=f"[{prds[index][1]}] "
+                )
+                for index in completed
+            ]
+        ))
+        for index, review in zip(completed, completed_reviews):
+            reviews[index] = review
+
+        return reviews
+
+    async def _acomplete_review(
+        self,
+        prd_text: str,
+        prd_name: str,
+        validation_report: dict,
+        skeptic_result: dict,
+        prefix: str = ""
+    ) -> dict:
+        """
+        Run the UX and Legal agents and compile the final review
+
+        Args:
+            prd_text: Full PRD text to review
+            prd_name: Name/title of the PRD
+            validation_report: Results from ValidatorAgent
+            skeptic_result: Results from SkepticAgent
+            prefix: Text prepended to progress lines (e.g. "[PRD name] ")
+
+        Returns:
+            Dictionary with complete review results from all agents
+        """
+        # Step 3: UX Agent (sync client, run off the event loop so batches overlap)
+        print(f"\n{prefix}Step 3/4: Running UX and Design Reviewer Agent...")
+        ux_result = await asyncio.to_thread(
+            self.ux_reviewer.review,
             prd_text,
             validation_report,
             skeptic_result['critique']
         )
-        print(f"   UX critique complete ({ux_result['total_tokens']} tokens)")
+        print(f"{prefix}   UX critique complete ({ux_result['total_tokens']} tokens)")
 
         # Step 4: Legal Agent
-        print("\nStep 4/4: Running Legal and Compliance Reviewer Agent...")
-        legal_result = self.legal_reviewer.review(
+        print(f"\n{prefix}Step 4/4: Running Legal and Compliance Reviewer Agent...")
+        legal_result = await asyncio.to_thread(
+            self.legal_reviewer.review,
             prd_text,
             validation_report,
             skeptic_result['critique'],
             ux_result['critique']
         )
-        print(f"   Legal critique complete ({legal_result['total_tokens']} tokens)")
+        print(f"{prefix}   Legal critique complete ({legal_result['total_tokens']} tokens)")
 
         # Compile final review
         total_tokens = (
@@ -95,7 +310,7 @@ class PRDReviewOrchestrator:
             "legal_critique": legal_result['critique'],
             "summary": self._generate_summary(validation_report, skeptic_result),
             "metadata": {
-                "validator_score": score,
+                "validator_score": validation_report['score'],
                 "validator_status": validation_report['status'],
                 "total_tokens": total_tokens,
                 "skeptic_tokens": skeptic_result['total_tokens'],
@@ -166,23 +381,42 @@ class PRDReviewOrchestrator:
             Path where review was saved
         """
         if not output_path:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             safe_name = review['prd_name'].replace(' ', '_').replace('/', '-')
-            output_path = f"output/{safe_name}_{timestamp}.json"
-
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(review, f, indent=2, ensure_ascii=False)
+            stem = f"output/{safe_name}_{timestamp}"
+            output_path = f"{stem}.json"
+
+            # PRDs sharing a title can be saved within the same second
+            sequence = 2
+            while output_path in self._saved_paths or os.path.exists(output_path):
+                output_path = f"{stem}_{sequence}.json"
+                sequence += 1
+
+        output_dir = os.path.dirname(output_path)
+        if output_dir and output_dir not in self._ensured_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            self._ensured_dirs.add(output_dir)
+
+        if orjson is not None:
+            Path(output_path).write_bytes(
+                orjson.dumps(review, default=str, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            Path(output_path).write_text(
+                json.dumps(review, indent=2, ensure_ascii=False, default=str),
+                encoding='utf-8'
+            )
 
+        self._saved_paths.add(output_path)
         return output_path
 
-    def print_review(self, review: dict):
+    def print_review(self, review: dict, critique_streamed: bool = False):
         """
         Pretty-print review to console
 
         Args:
             review: Review dictionary
+            critique_streamed: Technical critique was already streamed to the console
         """
         print(f"\n{'='*80}")
         print(f"FINAL REVIEW: {review['prd_name']}")
@@ -219,7 +453,10 @@ class PRDReviewOrchestrator:
         print(f"{'─'*80}")
         print("TECHNICAL CRITIQUE (Agent 2)")
         print(f"{'─'*80}")
-        print(review['technical_critique'])
+        if critique_streamed:
+            print("(streamed above)")
+        else:
+            print(review['technical_critique'])
         print()
 
         # UX critique
@@ -257,34 +494,60 @@ def main():
     """
     import sys
 
-    if len(sys.argv) < 2:
-        print("Usage: python orchestrator.py <prd_file.md>")
+    args = sys.argv[1:]
+    stream = '--stream' in args
+    batch = '--batch' in args
+    prd_files = [arg for arg in args if arg not in ('--stream', '--batch')]
+
+    # Concurrent and batched critiques would interleave or never stream
+    if not prd_files or (stream and (batch or len(prd_files) > 1)):
+        print("Usage: python orchestrator.py [--stream] <prd_file.md>")
+        print("       python orchestrator.py [--batch] <prd_file.md> [<prd_file.md> ...]")
+        print("\n--stream reviews a single PRD and cannot be combined with --batch.")
         print("\nExample:")
         print("  python orchestrator.py examples/sample_prd.md")
+        print("  python orchestrator.py --stream examples/sample_prd.md   # print critique as it arrives")
+        print("  python orchestrator.py --batch prds/*.md                 # Message Batches API, half price")
         sys.exit(1)
 
-    prd_file = sys.argv[1]
+    prds = []
+    for prd_file in prd_files:
+        try:
+            with open(prd_file, 'r', encoding='utf-8') as f:
+                prd_text = f.read()
+        except FileNotFoundError:
+            print(f"Error: File not found: {prd_file}")
+            sys.exit(1)
+
+        first_line = prd_text.split('\n')[0].strip()
+        if first_line.startswith('#'):
+            prd_name = first_line.lstrip('#').strip()
+        else:
+            prd_name = os.path.basename(prd_file).replace('.md', '')
 
-    try:
-        with open(prd_file, 'r', encoding='utf-8') as f:
-            prd_text = f.read()
-    except FileNotFoundError:
-        print(f"Error: File not found: {prd_file}")
-        sys.exit(1)
+        prds.append((prd_text, prd_name))
 
-    first_line = prd_text.split('\n')[0].strip()
-    if first_line.startswith('#'):
-        prd_name = first_line.lstrip('#').strip()
+    orchestrator = PRDReviewOrchestrator()
+    if batch:
+        reviews = orchestrator.review_many_batched(prds)
+    elif len(prds) == 1:
+        reviews = [orchestrator.review_prd(*prds[0], stream=stream)]
     else:
-        prd_name = os.path.basename(prd_file).replace('.md', '')
+        reviews = orchestrator.review_prd_many(prds)
 
-    orchestrator = PRDReviewOrchestrator()
-    review = orchestrator.review_prd(prd_text, prd_name)
+    failed = [prd_name for (_, prd_name), review in zip(prds, reviews) if review is None]
+    for review in reviews:
+        if review is None:
+            continue
 
-    orchestrator.print_review(review)
+        orchestrator.print_review(review, critique_streamed=stream)
 
-    output_path = orchestrator.save_review(review)
-    print(f"Review saved to: {output_path}\n")
+        output_path = orchestrator.save_review(review)
+        print(f"Review saved to: {output_path}\n")
+
+    if failed:
+        print(f"Reviews failed for {len(failed)} PRD(s): {', '.join(failed)}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
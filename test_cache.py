@@ -0,0 +1,76 @@
+"""
+Test the Skeptic response cache (no API key needed)
+"""
+
+import os
+import shutil
+import tempfile
+
+from agents.skeptic_agent import SkepticAgent
+from agents.validator_agent import ValidatorAgent
+from utils.cache import DiskCache
+
+# Load sample PRD
+with open('examples/sample_prd.md', 'r', encoding='utf-8') as f:
+    prd_text = f.read()
+
+validator = ValidatorAgent('templates/prd_template.yaml')
+validation_report = validator.format_report(*validator.validate(prd_text))
+
+print("=" * 60)
+print("SKEPTIC CACHE TEST")
+print("=" * 60)
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    cache_dir = os.path.join(tmp_dir, 'skeptic')
+    cache = DiskCache(cache_dir)
+
+    # Round trip and miss
+    entry = {"critique": "Cached critique", "total_tokens": 42}
+    cache.set('round-trip', entry)
+    assert cache.get('round-trip') == entry
+    assert cache.get('missing') is None
+    assert os.listdir(cache_dir) == ['round-trip.json'], os.listdir(cache_dir)
+    print("\n✅ Round trip and miss")
+
+    # Corrupt or unreadable entries are misses, not errors
+    with open(os.path.join(cache_dir, 'not-utf8.json'), 'wb') as f:
+        f.write(b'\xff\xfe\x00')
+    os.mkdir(os.path.join(cache_dir, 'directory.json'))
+    assert cache.get('not-utf8') is None
+    assert cache.get('directory') is None
+    print("✅ Corrupt and unreadable entries read as misses")
+
+    # A hit is flagged and reports zero usage; the stored entry is unchanged
+    agent = SkepticAgent(api_key='test-key', cache=cache)
+    validation_summary = agent._build_validation_summary(validation_report)
+    stored = {
+        "critique": "Previously generated critique",
+        "model": agent.model,
+        "prompt_tokens": 900,
+        "completion_tokens": 300,
+        "total_tokens": 1200,
+        "cache_read_tokens": 0,
+        "cache_creation_tokens": 0,
+        "cached": False
+    }
+    cache.set(agent._cache_key(prd_text, validation_summary), stored)
+
+    result = agent.challenge(prd_text, validation_report)
+    assert result['cached'] is True
+    assert result['critique'] == stored['critique']
+    assert result['prompt_tokens'] == result['completion_tokens'] == result['total_tokens'] == 0
+    assert cache.get(agent._cache_key(prd_text, validation_summary)) == stored
+    print("✅ Cache hit flagged with zero token usage")
+
+    # Writing to a cache directory that is no longer writable must not raise
+    shutil.rmtree(cache_dir)
+    with open(cache_dir, 'w') as f:
+        f.write('not a directory')
+    cache.set('unwritable', entry)
+    assert cache.get('unwritable') is None
+    print("✅ Write to unwritable cache directory ignored")
+
+print("\n" + "=" * 60)
+print("✅ Skeptic cache working!")
+print("=" * 60)
@@ -0,0 +1,51 @@
+"""
+Test Skeptic prompt truncation (no API key needed)
+"""
+
+from agents.skeptic_agent import truncate_prd, TRUNCATION_MARKER
+
+BUDGET = 20000
+
+# Load sample PRD
+with open('examples/sample_prd.md', 'r', encoding='utf-8') as f:
+    prd_text = f.read()
+
+print("=" * 60)
+print("SKEPTIC PROMPT BUDGET TEST")
+print("=" * 60)
+
+# PRDs within budget (or with truncation disabled) pass through unchanged
+assert truncate_prd(prd_text, BUDGET) == prd_text
+assert truncate_prd(prd_text * 20, 0) == prd_text * 20
+print("\n✅ Short PRD and disabled budget left unchanged")
+
+# Title heading followed by one huge body: the body fills the budget
+single_section = "# Checkout Redesign\n" + "Body text. " * 3000
+truncated = truncate_prd(single_section, BUDGET)
+assert len(truncated) == BUDGET, len(truncated)
+assert truncated.startswith("# Checkout Redesign\n")
+assert truncated.endswith(TRUNCATION_MARKER)
+print(f"✅ Single oversized section: kept {len(truncated)}/{BUDGET} chars")
+
+# Oversized early section: earlier sections kept whole, then filled to budget
+multi_section = (
+    "# Title\n\n"
+    "## Problem\n" + "Problem detail. " * 1600 + "\n"
+    "## Goals\n- Reduce abandonment\n"
+)
+truncated = truncate_prd(multi_section, BUDGET)
+assert len(truncated) == BUDGET, len(truncated)
+assert truncated.startswith("# Title\n\n## Problem\n")
+assert truncated.endswith(TRUNCATION_MARKER)
+print(f"✅ Oversized middle section: kept {len(truncated)}/{BUDGET} chars")
+
+# Whole sections kept in order when a later one overflows
+truncated = truncate_prd(prd_text, 1200)
+assert len(truncated) <= 1200
+assert truncated.startswith("# Apple Pay Integration - UK Market\n")
+assert "## Success Metrics" in truncated
+print(f"✅ Sample PRD at 1200 chars: kept {len(truncated)} chars")
+
+print("\n" + "=" * 60)
+print("✅ Prompt budget working!")
+print("=" * 60)
@@ -2,46 +2,78 @@
 Test the Validator Agent
 """
 
+from agents import validator_agent
 from agents.validator_agent import ValidatorAgent
 
-# Load sample PRD
-with open('examples/sample_prd.md', 'r', encoding='utf-8') as f:
-    prd_text = f.read()
-
-# Initialize agent
-agent = ValidatorAgent('templates/prd_template.yaml')
-
-# Run validation
-results, score = agent.validate(prd_text)
-
-# Format report
-report = agent.format_report(results, score)
-
-# Print results
-print("=" * 60)
-print("VALIDATOR AGENT TEST")
-print("=" * 60)
-print(f"\nOverall Score: {report['score']}/100 {report['status_emoji']}")
-print(f"Status: {report['status']}")
-print(f"\nSections Found: {report['found_count']}/{report['total_sections']}")
-
-if report['missing_critical']:
-    print(f"\n🔴 Critical Missing ({len(report['missing_critical'])}):")
-    for section in report['missing_critical']:
-        print(f"  • {section}")
-
-if report['missing_high']:
-    print(f"\n🟡 High Priority Missing ({len(report['missing_high'])}):")
-    for section in report['missing_high']:
-        print(f"  • {section}")
-
-if report['found_sections']:
-    print(f"\n✅ Found Sections:")
-    for section in report['found_sections'][:5]:
-        print(f"  • {section}")
-    if len(report['found_sections']) > 5:
-        print(f"  ... and {len(report['found_sections']) - 5} more")
-
-print("\n" + "=" * 60)
-print("✅ Validator Agent Working!")
-print("=" * 60)
\ No newline at end of file
+
+def main():
+    # Load sample PRD
+    with open('examples/sample_prd.md', 'r', encoding='utf-8') as f:
+        prd_text = f.read()
+
+    # Initialize agent
+    agent = ValidatorAgent('templates/prd_template.yaml')
+
+    # Run validation
+    results, score = agent.validate(prd_text)
+
+    # Format report
+    report = agent.format_report(results, score)
+
+    # Print results
+    print("=" * 60)
+    print("VALIDATOR AGENT TEST")
+    print("=" * 60)
+    print(f"\nOverall Score: {report['score']}/100 {report['status_emoji']}")
+    print(f"Status: {report['status']}")
+    print(f"\nSections Found: {report['found_count']}/{report['total_sections']}")
+
+    if report['missing_critical']:
+        print(f"\n🔴 Critical Missing ({len(report['missing_critical'])}):")
+        for section in report['missing_critical']:
+            print(f"  • {section}")
+
+    if report['missing_high']:
+        print(f"\n🟡 High Priority Missing ({len(report['missing_high'])}):")
+        for section in report['missing_high']:
+            print(f"  • {section}")
+
+    if report['found_sections']:
+        print(f"\n✅ Found Sections:")
+        for section in report['found_sections'][:5]:
+            print(f"  • {section}")
+        if len(report['found_sections']) > 5:
+            print(f"  ... and {len(report['found_sections']) - 5} more")
+
+    # The regex fallback (no pyahocorasick) must match exactly like the automaton
+    installed_ahocorasick = validator_agent.ahocorasick
+    validator_agent.ahocorasick = None
+    try:
+        regex_agent = ValidatorAgent('templates/prd_template.yaml')
+    finally:
+        validator_agent.ahocorasick = installed_ahocorasick
+
+    assert regex_agent._ac is None
+    assert regex_agent.validate(prd_text) == (results, score), "regex fallback disagrees with matcher"
+    print("\n✅ Regex fallback matches")
+
+    # validate_batch through the worker pool must match validate() one by one
+    texts = [prd_text, prd_text.upper(), prd_text[:2000], "# Empty PRD\n"]
+    parallel_min_chars = validator_agent.PARALLEL_MIN_CHARS
+    validator_agent.PARALLEL_MIN_CHARS = 0
+    try:
+        batch_results = agent.validate_batch(texts, max_workers=2)
+    finally:
+        validator_agent.PARALLEL_MIN_CHARS = parallel_min_chars
+
+    assert batch_results == [agent.validate(text) for text in texts], "validate_batch disagrees with validate"
+    print("✅ validate_batch matches validate")
+
+    print("\n" + "=" * 60)
+    print("✅ Validator Agent Working!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    # validate_batch() spawns worker processes that re-import this script
+    main()
@@ -0,0 +1,164 @@
+"""
+Response cache for AI agents
+Stores Claude critiques on disk so identical reviews skip the API call,
+with an optional embedding-based tier for near-duplicate PRDs
+"""
+
+import os
+import json
+import hashlib
+from typing import Dict, List, Optional, Protocol, Tuple
+
+
+class CacheBackend(Protocol):
+    """Minimal key/value interface an agent cache must provide"""
+
+    def get(self, key: str) -> Optional[Dict]:
+        ...
+
+    def set(self, key: str, value: Dict) -> None:
+        ...
+
+
+def make_cache_key(**fields) -> str:
+    """
+    Build a stable SHA-256 cache key from prompt inputs
+
+    Args:
+        **fields: JSON-serialisable values that determine the response
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class DiskCache:
+    """
+    Exact-match cache storing one JSON file per key
+
+    Survives process restarts, so repeated CLI/CI runs over the same PRD
+    reuse the earlier critique instead of calling Claude again.
+    """
+
+    def __init__(self, directory: str = ".cache/skeptic"):
+        """
+        Initialize disk cache
+
+        Args:
+            directory: Folder where cached responses are written
+        """
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Return the cached value for key, or None on a miss
+
+        Unreadable or corrupt entries count as misses, like failed writes in
+        set(), so a broken cache never aborts a review.
+        """
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):  # ValueError covers JSON and UTF-8 decode errors
+            return None
+
+    def set(self, key: str, value: Dict) -> None:
+        """
+        Store value under key, replacing any existing entry atomically
+
+        Write failures (full disk, read-only directory) are ignored: losing
+        a cache entry must not lose the critique that was just paid for.
+        """
+        path = self._path(key)
+        # Per-process temp name so concurrent writers never share a file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+class SemanticCache:
+    """
+    Similarity cache matching PRDs by sentence-embedding cosine similarity
+
+    Reuses a critique when a new PRD is a near-duplicate of one already
+    reviewed (e.g. a typo fix). Requires the optional sentence-transformers
+    package; entries are held in memory for the life of the process.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
+    ):
+        """
+        Initialize semantic cache
+
+        Args:
+            threshold: Minimum cosine similarity to count as a hit
+            model_name: Sentence-transformers model used for embeddings
+        """
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as exc:
+            raise ImportError(
+                "SemanticCache requires sentence-transformers: "
+                "pip install sentence-transformers"
+            ) from exc
+
+        self.threshold = threshold
+        self.model = SentenceTransformer(model_name)
+        self._embeddings: List = []
+        self._values: List[Tuple[str, Dict]] = []
+
+    def _embed(self, text: str):
+        return self.model.encode(text, normalize_embeddings=True)
+
+    def get(self, text: str, scope: str = "") -> Optional[Dict]:
+        """
+        Return the value stored for the most similar text, if close enough
+
+        Args:
+            text: Text to match (the PRD)
+            scope: Extra context that must match exactly (e.g. model + prompt key)
+
+        Returns:
+            Cached value, or None when no entry clears the threshold
+        """
+        if not self._embeddings:
+            return None
+
+        query = self._embed(text)
+        best_score, best_value = 0.0, None
+        for embedding, (entry_scope, value) in zip(self._embeddings, self._values):
+            if entry_scope != scope:
+                continue
+            score = float(query @ embedding)
+            if score > best_score:
+                best_score, best_value = score, value
+
+        return best_value if best_score >= self.threshold else None
+
+    def set(self, text: str, value: Dict, scope: str = "") -> None:
+        """
+        Store value against the embedding of text
+
+        Args:
+            text: Text to index (the PRD)
+            value: Response to reuse for similar texts
+            scope: Extra context that must match exactly on lookup
+        """
+        self._embeddings.append(self._embed(text))
+        self._values.append((scope, value))
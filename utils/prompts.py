@@ -0,0 +1,26 @@
+"""
+System prompt loading shared by the AI agents
+"""
+
+import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
+def _read_text(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def load_prompt(path: str) -> str:
+    """
+    Read a system prompt file, once per process
+
+    Args:
+        path: Path to the prompt file (relative paths resolve against the cwd)
+
+    Returns:
+        Prompt text
+    """
+    # Absolute path so a later cwd change cannot return a stale entry
+    return _read_text(os.path.abspath(path))